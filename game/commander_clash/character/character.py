@@ -16,6 +16,10 @@ class Character(GameObject):
     help with the game mechanics.
     """
 
+    __slots__ = ('__name', '__class_type', '__current_health', '__max_health', '__attack', '__defense', '__speed',
+                 'rank_type', '__moveset', '__special_points', '__position', '__took_action', '__country_type',
+                 '__is_dead', '__selected_move', '__index')
+
     def __init__(self, name: str = '', class_type: ClassType = ClassType.ATTACKER, health: int = 1,
                  attack: AttackStat = AttackStat(), defense: DefenseStat = DefenseStat(),
                  speed: SpeedStat = SpeedStat(), position: Vector | None = None,
@@ -265,6 +269,8 @@ class Generic(Character):
     functionality.
     """
 
+    __slots__ = ()
+
     def __init__(self, name: str = '', class_type: ClassType = ClassType.ATTACKER, health: int = 1,
                  attack: AttackStat = AttackStat(), defense: DefenseStat = DefenseStat(),
                  speed: SpeedStat = SpeedStat(), position: Vector | None = None,
@@ -276,6 +282,8 @@ class Generic(Character):
 
 
 class GenericAttacker(Generic):
+    __slots__ = ()
+
     def __init__(self, name: str = '', class_type: ClassType = ClassType.ATTACKER, health: int = 1,
                  attack: AttackStat = AttackStat(), defense: DefenseStat = DefenseStat(),
                  speed: SpeedStat = SpeedStat(), position: Vector | None = None,
@@ -289,6 +297,8 @@ class GenericAttacker(Generic):
 
 
 class GenericHealer(Generic):
+    __slots__ = ()
+
     def __init__(self, name: str = '', class_type: ClassType = ClassType.HEALER, health: int = 1,
                  attack: AttackStat = AttackStat(), defense: DefenseStat = DefenseStat(),
                  speed: SpeedStat = SpeedStat(), position: Vector | None = None,
@@ -301,6 +311,8 @@ class GenericHealer(Generic):
 
 
 class GenericTank(Generic):
+    __slots__ = ()
+
     def __init__(self, name: str = '', class_type: ClassType = ClassType.TANK, health: int = 1,
                  attack: AttackStat = AttackStat(), defense: DefenseStat = DefenseStat(),
                  speed: SpeedStat = SpeedStat(), position: Vector | None = None,
@@ -313,6 +325,8 @@ class GenericTank(Generic):
 
 
 class GenericTrash(Generic):
+    __slots__ = ()
+
     def __init__(self, name: str = GENERIC_TRASH_NAME, class_type: ClassType = ClassType.ATTACKER,
                  position: Vector | None = None, country_type: CountryType = CountryType.URODA):
         # No matter what, the stats should be set to 1, even the health
@@ -329,6 +343,8 @@ class GenericTrash(Generic):
 
 
 class Leader(Character):
+    __slots__ = ()
+
     def __init__(self, name: str = '', class_type: ClassType = ClassType.ATTACKER, health: int = 1,
                  attack: AttackStat = AttackStat(), defense: DefenseStat = DefenseStat(),
                  speed: SpeedStat = SpeedStat(), position: Vector | None = None,
@@ -29,6 +29,8 @@ class Stat(GameObject):
     This is why the base_value and value properties are type hinted as int | float.
     """
 
+    __slots__ = ('__base_value', '__value')
+
     def __init__(self, base_value: int = 1):
         super().__init__()
 
@@ -121,6 +123,8 @@ class Stat(GameObject):
 
 
 class AttackStat(Stat):
+    __slots__ = ()
+
     def __init__(self, base_value: int = 1):
         super().__init__(base_value)
         self.object_type = ObjectType.ATTACK_STAT
@@ -133,6 +137,8 @@ class AttackStat(Stat):
 
 
 class DefenseStat(Stat):
+    __slots__ = ()
+
     def __init__(self, base_value: int = 1):
         super().__init__(base_value)
         self.object_type = ObjectType.DEFENSE_STAT
@@ -145,6 +151,8 @@ class DefenseStat(Stat):
 
 
 class SpeedStat(Stat):
+    __slots__ = ()
+
     def __init__(self, base_value: int = 1):
         super().__init__(base_value)
         self.object_type = ObjectType.SPEED_STAT
@@ -10,9 +10,10 @@ def generate_locations_dict(team_managers: list[TeamManager]) -> dict:
     ...
 
 
-def update_character_info(team_managers: list[TeamManager]):
+def update_character_info(team_managers: list[TeamManager], world: dict | None = None):
     """
-    Gives all characters in the team managers their country affiliation and positions.
+    Gives all characters in the team managers their country affiliation and positions. If a world is given, the team
+    managers are updated in it; otherwise, they are updated in the game map file.
     """
     ...
 
@@ -7,6 +7,14 @@ from game.common.game_object import GameObject
 
 
 class AbstractMove(GameObject):
+    # Moves and effects combine these classes with multiple inheritance (e.g., Attack is a Move and an AbstractAttack),
+    # and Python doesn't allow a class to inherit from more than one class that adds slots. Every slot of the moves and
+    # effects is declared here instead, and the subclasses don't add any.
+    __slots__ = ('__move_type', '__target_type', '_AbstractAttack__damage_points',
+                 '_AbstractHeal__heal_points', '_AbstractBuff__buff_amount', '_AbstractBuff__stat_to_affect',
+                 '_AbstractDebuff__debuff_amount', '_AbstractDebuff__stat_to_affect', '_Move__name', '_Move__cost',
+                 '_Move__effect', 'priority')
+
     def __init__(self, target_type: TargetType = TargetType.SELF):
         super().__init__()
         self.move_type = MoveType.MOVE
@@ -36,6 +44,8 @@ class AbstractMove(GameObject):
 
 
 class AbstractAttack(AbstractMove):
+    __slots__ = ()
+
     def __init__(self, target_type: TargetType = TargetType.SELF, damage_points: int = 0):
         super().__init__(target_type)
         self.damage_points: int = damage_points
@@ -54,6 +64,8 @@ class AbstractAttack(AbstractMove):
 
 
 class AbstractHeal(AbstractMove):
+    __slots__ = ()
+
     def __init__(self, target_type: TargetType = TargetType.SELF, heal_points: int = 0):
         super().__init__(target_type)
         self.heal_points: int = heal_points
@@ -72,6 +84,8 @@ class AbstractHeal(AbstractMove):
 
 
 class AbstractBuff(AbstractMove):
+    __slots__ = ()
+
     def __init__(self, target_type: TargetType = TargetType.SELF, buff_amount: int = 1,
                  stat_to_affect: ObjectType = ObjectType.ATTACK_STAT):
         super().__init__(target_type)
@@ -109,6 +123,8 @@ class AbstractBuff(AbstractMove):
 
 
 class AbstractDebuff(AbstractMove):
+    __slots__ = ()
+
     def __init__(self, target_type: TargetType = TargetType.SELF, debuff_amount: int = -1,
                  stat_to_affect: ObjectType = ObjectType.ATTACK_STAT):
         super().__init__(target_type)
@@ -11,12 +11,16 @@ class Effect(AbstractMove):
     more. These inherit from AbstractMove since they have common attributes.
     """
 
+    __slots__ = ()
+
     def __init__(self, target_type: TargetType = TargetType.SELF):
         super().__init__(target_type)
         self.object_type = ObjectType.EFFECT
 
 
 class AttackEffect(AbstractAttack, Effect):
+    __slots__ = ()
+
     def __init__(self, target_type: TargetType = TargetType.SELF, damage_points: int = 1):
         super().__init__(target_type, damage_points)
         self.object_type = ObjectType.ATTACK_EFFECT
@@ -31,6 +35,8 @@ class AttackEffect(AbstractAttack, Effect):
 
 
 class HealEffect(AbstractHeal, Effect):
+    __slots__ = ()
+
     def __init__(self, target_type: TargetType = TargetType.SELF, heal_points: int = 0):
         super().__init__(target_type, heal_points)
         self.object_type = ObjectType.HEAL_EFFECT
@@ -45,6 +51,8 @@ class HealEffect(AbstractHeal, Effect):
 
 
 class BuffEffect(AbstractBuff, Effect):
+    __slots__ = ()
+
     def __init__(self, target_type: TargetType = TargetType.SELF, buff_amount: int = 1,
                  stat_to_affect: ObjectType = ObjectType.ATTACK_STAT):
         super().__init__(target_type, buff_amount, stat_to_affect)
@@ -60,6 +68,8 @@ class BuffEffect(AbstractBuff, Effect):
 
 
 class DebuffEffect(AbstractDebuff, Effect):
+    __slots__ = ()
+
     def __init__(self, target_type: TargetType = TargetType.SELF, debuff_amount: int = -1,
                  stat_to_affect: ObjectType = ObjectType.ATTACK_STAT):
         super().__init__(target_type, debuff_amount, stat_to_affect)
@@ -5,6 +5,8 @@ from game.common.enums import MoveType, ObjectType
 
 
 class Move(AbstractMove):
+    __slots__ = ()
+
     def __init__(self, name: str = '', target_type: TargetType = TargetType.SINGLE_OPP, cost: int = 0,
                  effect: Effect | None = None):
         super().__init__(target_type)
@@ -49,6 +51,8 @@ class Move(AbstractMove):
 
 
 class Attack(Move, AbstractAttack):
+    __slots__ = ()
+
     def __init__(self, name: str = '', target_type: TargetType = TargetType.SINGLE_OPP, cost: int = 0,
                  effect: Effect | None = None, damage_points: int = 0):
         super().__init__(name, target_type, cost, effect)
@@ -69,6 +73,8 @@ class Attack(Move, AbstractAttack):
 
 
 class Heal(Move, AbstractHeal):
+    __slots__ = ()
+
     def __init__(self, name: str = '', target_type: TargetType = TargetType.ENTIRE_TEAM, cost: int = 0,
                  effect: Effect | None = None, heal_points: int = 0):
         super().__init__(name, target_type, cost, effect)
@@ -89,6 +95,8 @@ class Heal(Move, AbstractHeal):
 
 
 class Buff(Move, AbstractBuff):
+    __slots__ = ()
+
     def __init__(self, name: str = '', target_type: TargetType = TargetType.ENTIRE_TEAM, cost: int = 0,
                  effect: Effect | None = None, buff_amount: int = 1,
                  stat_to_affect: ObjectType = ObjectType.ATTACK_STAT):
@@ -112,6 +120,8 @@ class Buff(Move, AbstractBuff):
 
 
 class Debuff(Move, AbstractDebuff):
+    __slots__ = ()
+
     def __init__(self, name: str = '', target_type: TargetType = TargetType.SINGLE_OPP, cost: int = 0,
                  effect: Effect | None = None, debuff_amount: int = -1,
                  stat_to_affect: ObjectType = ObjectType.ATTACK_STAT):
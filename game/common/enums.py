@@ -113,3 +113,40 @@ class ActionType(Enum):
     USE_S2 = 4
     SWAP_UP = 5
     SWAP_DOWN = 6
+
+
+class EventType(Enum):
+    TEXT = 1
+    TURN_START = 2
+    ACTIVE_PAIR = 3
+    SPEED_TIE = 4
+    DIED_BEFORE_TURN = 5
+    NO_SELECTED_MOVE = 6
+    MOVE_START = 7
+    NOT_ENOUGH_SPECIAL_POINTS = 8
+    NO_TARGETS = 9
+    NO_EFFECT_TARGETS = 10
+    DAMAGE = 11
+    EFFECT_DAMAGE = 12
+    HEAL = 13
+    EFFECT_HEAL = 14
+    STAT_CHANGE = 15
+    EFFECT_STAT_CHANGE = 16
+    DEFEAT = 17
+    SCORE = 18
+    SWAP = 19
+    SWAP_WITH = 20
+    SWAP_OFF_MAP = 21
+    NO_ACTIVE_CHARACTER = 22
+
+
+# These map the values written to json to the members of the enums. Trusted json uses them since a lookup is much
+# faster than calling the enum, which checks the value first.
+OBJECT_TYPES: dict[int, ObjectType] = {member.value: member for member in ObjectType}
+COUNTRY_TYPES: dict[int, CountryType] = {member.value: member for member in CountryType}
+MOVE_TYPES: dict[int, MoveType] = {member.value: member for member in MoveType}
+TARGET_TYPES: dict[int, TargetType] = {member.value: member for member in TargetType}
+CLASS_TYPES: dict[int, ClassType] = {member.value: member for member in ClassType}
+RANK_TYPES: dict[int, RankType] = {member.value: member for member in RankType}
+EVENT_TYPES: dict[int, EventType] = {member.value: member for member in EventType}
+ACTION_TYPES: dict[int, ActionType] = {member.value: member for member in ActionType}
@@ -1,7 +1,42 @@
+import functools
+import random
+import threading
 import uuid
 
 from game.common.enums import ObjectType
-from typing import Self
+from typing import Self, TypeVar
+
+# the ids of GameObjects are drawn from this generator; it's only seeded by seed_ids(), so ids are random otherwise
+_id_random: random.Random = random.Random()
+_id_lock: threading.Lock = threading.Lock()
+
+T = TypeVar('T', bound='GameObject')
+
+
+def seed_ids(seed: int | None, stream: str = '') -> None:
+    """
+    Seeds the ids given to GameObjects, so a game with the same seed gives its objects the same ids. Every stream of a
+    seed gives different ids. Use a different stream for every step of a game that runs on its own (e.g., generating
+    the game map and running the game) so the ids of one step are never reused by the next.
+    """
+    ...
+
+
+def new_id() -> str:
+    """
+    Returns the next id from the seeded id generator. The ids are formatted like version 4 UUIDs.
+    """
+    ...
+
+
+def decode_json(cls: type[T], data: dict, trusted: bool = False) -> T:
+    """
+    Returns a new object of the given class made from its json. Only trust json that the game wrote itself (e.g., the
+    world file, the turn logs, and the logs read by the visualizer). A trusted decode skips ``__init__()`` and the
+    property setters and fills the new object directly, so nothing in the json is checked. Json that comes from a user
+    client must never be trusted.
+    """
+    ...
 
 
 class GameObject:
@@ -11,11 +46,99 @@ class GameObject:
         This class is widely used throughout the project to represent different types of Objects that are interacted
         with in the game. If a new class is created and needs to be logged to the JSON files, make sure it inherits
         from GameObject.
+
+        Snapshots:
+            The ``snapshot()`` method creates an isolated copy of an object that can be given to a user client. The
+            copy is made on write: a snapshot starts out empty and only copies its attributes from the original the
+            first time one of them is read, so a client only pays for the objects it uses. Values that can't be
+            changed are shared instead of copied.
+
+            Every memo is an epoch. Before an object changes while a snapshot of an earlier epoch could still read
+            it, ``before_change()`` saves the state the object had, and snapshots read that saved state instead. This
+            way a snapshot always has the state the objects had when it was taken, no matter when it's read. Setting
+            an attribute calls ``before_change()`` on its own; code that changes a list or dict of an object in place
+            (e.g., appending to it) has to call it first. The saved states are dropped once every snapshot of their
+            epochs is either read or gone. Snapshots themselves are never saved, so a snapshot of a snapshot is copied
+            right away instead.
+
+        IDs:
+            An object's id is only made the first time it's used (usually when the object is written to json). Most
+            objects are either thrown away or given an id by ``from_json()`` before that, so they never need one. The
+            ids are drawn from a generator seeded with ``seed_ids()``, so games with the same seed log the same ids.
+
+        Slots:
+            GameObject uses ``__slots__``. Subclasses that don't define ``__slots__`` still store the rest of their
+            attributes in a ``__dict__``; the objects that are created the most (characters, stats, moves, and effects)
+            define their own slots so they don't have a ``__dict__`` at all. Use ``get_state()`` instead of
+            ``__dict__`` to read every attribute of an object.
+
+        Trusted JSON:
+            ``from_json()`` validates every value through the property setters. When ``trusted`` is True, the values
+            are stored directly instead, which is much faster. Every subclass that overrides ``from_json()`` must pass
+            ``trusted`` on to ``super().from_json()`` and to the objects it decodes, and must set every attribute its
+            ``__init__()`` sets, since ``decode_json()`` skips ``__init__()`` for trusted json.
     """
+
+    __slots__ = ('__id', '__epoch', '__snapshot_source', '__weakref__', 'object_type', 'state')
+
     def __init__(self, **kwargs):
-        self.id = str(uuid.uuid4())
+        self.__start_tracking()
+        self.__id: str | None = None
         self.object_type = ObjectType.NONE
         self.state = "idle"
 
+    @property
+    def id(self) -> str:
+        if self.__id is None:
+            # making the id isn't a change that snapshots need to be protected from
+            object.__setattr__(self, '_GameObject__id', new_id())
+
+        return self.__id
+
+    @id.setter
+    def id(self, id: str) -> None:
+        self.__id = id
+
+    def snapshot(self, memo: dict | None = None) -> Self:
+        """
+        Returns a copy of this object that doesn't share any mutable state with it. The copy has the state this object
+        had when the memo's first snapshot was taken, and only copies it when it's first read. The memo maps every
+        object that was already copied to its copy. Use the same memo for every snapshot given to the same client so
+        objects that are referenced from multiple places (e.g., a character in the game map and in a team manager) are
+        still the same object in the copies.
+        """
+        ...
+
+    def before_change(self) -> None:
+        """
+        Saves the state this object has for the snapshots that could still read it. Setting an attribute calls this on
+        its own; call it before changing a list or dict of this object in place.
+        """
+        ...
+
+    def __setattr__(self, name: str, value: object) -> None:
+        ...
+
+    def __setstate__(self, state: dict) -> None:
+        ...
+
     def obfuscate(self):
         pass
+
+
+@functools.cache
+def slot_descriptors(cls: type) -> dict[str, object]:
+    """
+    Returns the slots of the given class and every class it inherits from by name. Private names are mangled the same
+    way Python mangles them. The slots are read with their descriptors since a subclass can hide a slot behind a
+    property of the same name (e.g., ``TeamManager.object_type``).
+    """
+    ...
+
+
+def get_state(obj: object) -> dict[str, object]:
+    """
+    Returns every attribute that is set on the given object by name, whether it's stored in a slot or in the object's
+    ``__dict__``.
+    """
+    ...
@@ -111,6 +111,42 @@ class GameBoard(GameObject):
             x       x
             x       x
             x x x x x   y = 6
+
+    -----
+
+    Game Map:
+    ---------
+        Once the map is generated, every coordinate's GameObjectContainer is stored in a flat list (the cells) at the
+        index ``y * width + x``; coordinates with nothing on them are None. Locations outside the map size can't be
+        stored in the cells, so they're kept in a separate dict. The board also keeps two indexes that are updated
+        every time a cell changes: the characters on the map by country and the position of every character by name.
+        This makes ``get_character_from()`` and ``is_occupiable()`` O(1) and ``get_characters()`` O(team size), no
+        matter how big the map is.
+
+        The indexes are only updated by the GameBoard's methods (e.g., ``place()``, ``remove()``, ``replace()``, and
+        ``remove_coordinate()``), so always change the map with them. The ``game_map`` property makes a new dict of
+        the cells every time it's used, so changing that dict doesn't change the board.
+
+    -----
+
+    Characters:
+    -----------
+        The team managers are the one place every character is kept. Once ``share_characters()`` is called with the
+        team managers, the game map, ``ordered_teams``, and ``recently_died`` hold the same Character objects as the
+        team managers instead of their own copies, so a change made to a character through any of them is seen by all
+        of them. Nothing has to be copied between the references after a character swaps or uses a move.
+
+        A GameBoard decoded from json has its own copies of the characters, so ``share_characters()`` needs to be
+        called again after decoding.
+
+    -----
+
+    Events:
+    -------
+        Everything that happens during a turn is recorded in the ``events`` list with ``add_event()``. An event is a
+        tuple of its EventType and the values that describe it (e.g., who dealt how much damage to whom), so recording
+        one is cheap and the events can be read by other programs. The text of the events is only made when
+        ``turn_info`` is used; refer to game/utils/events.py for the text of every EventType.
     """
 
     def __init__(self, seed: int | None = None, map_size: Vector = Vector(),
@@ -136,7 +172,7 @@ class GameBoard(GameObject):
 
         self.recently_died: list[Character] = []
 
-        self.turn_info: str = ''
+        self.events: list[tuple] = []
 
         self.active_pair_index: int = 0
 
@@ -156,13 +192,18 @@ class GameBoard(GameObject):
 
     @property
     def game_map(self) -> dict[Vector, GameObjectContainer] | None:
-        return self.__game_map
+        """
+        Returns a new dict of every coordinate that has a GameObjectContainer, ordered by the index of its cell.
+        Changing the dict doesn't change the board; use the GameBoard's methods for that.
+        """
+        ...
 
     @game_map.setter
     def game_map(self, game_map: dict[Vector, GameObjectContainer] | None) -> None:
-        if game_map is not None and not isinstance(game_map, dict) \
-                and any([not isinstance(vec, Vector) or not isinstance(go_container, GameObjectContainer)
-                         for vec, go_container in game_map.items()]):
+        if game_map is not None and (not isinstance(game_map, dict) or
+                                     any([not isinstance(vec, Vector) or
+                                          not isinstance(go_container, GameObjectContainer)
+                                          for vec, go_container in game_map.items()])):
             raise ValueError(
                 f'{self.__class__.__name__}.game_map must be a dict[Vector, GameObjectContainer].'
                 f'It has a value of {game_map}.'
@@ -215,6 +256,20 @@ class GameBoard(GameObject):
 
         self.__walled = walled
 
+    @property
+    def turn_info(self) -> str:
+        """
+        Returns the text of every event recorded this turn.
+        """
+        ...
+
+    def add_event(self, event_type: EventType, *values) -> None:
+        """
+        Records an event of the given type with the values that describe it. Refer to game/utils/events.py for the
+        values every EventType needs.
+        """
+        ...
+
     def get_ordered_teams_as_list(self) -> list[Character]:
         """
         Returns a list that will have the exact order every character will take their turn in. Returns a list
@@ -329,7 +384,14 @@ class GameBoard(GameObject):
 
     def get_characters(self, country: CountryType | None = None) -> dict[Vector, Character]:
         """
-        Returns a dictionary of Vector: Character pair.
+        Returns a dictionary of Vector: Character pair. If a country is given, only that country's characters are
+        returned. The characters are read from the board's index, so this only takes as long as the teams are big.
+        """
+        ...
+
+    def get_character_position(self, name: str) -> Vector | None:
+        """
+        Returns the position of the character with the given name on the game map, or None if it isn't on the map.
         """
         ...
 
@@ -389,6 +451,14 @@ class GameBoard(GameObject):
         """
         ...
 
+    def share_characters(self, uroda_team_manager: TeamManager, turpis_team_manager: TeamManager) -> None:
+        """
+        Replaces every character on the game map, in ``ordered_teams``, and in ``recently_died`` with the character of
+        the same name from the given team managers, so there is only one object for each character. Characters that
+        are already the team managers' objects are left alone, so this is cheap to call every turn.
+        """
+        ...
+
     def get_char_from_ordered_teams(self, char_name: str) -> Character | None:
         """
         Searches for the character by the given name in the `ordered_teams` list. If the character is not found, None
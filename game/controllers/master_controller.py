@@ -24,6 +24,17 @@ class MasterController(Controller):
         Interpret Current Turn Data:
             This accesses the gameboard in the first turn of the game and generates the game's seed.
 
+        Live Game Board:
+            The master controller keeps one authoritative GameBoard object for the whole game. The generated world is
+            only decoded once; every turn after that works on the same object. The board is only serialized when the
+            world is requested as JSON (e.g., when a turn log is created).
+
+            Since the board isn't decoded again every turn, what the controllers set on the characters is kept from one
+            turn to the next. A character's ``took_action`` is set when it uses its move and stays True until every
+            character left in its team has acted, and the team managers, the game board, and the turn logs all show the
+            same value. When the board was decoded every turn, the flag was often set on a copy that was thrown away,
+            so the turn logs showed it differently from turn to turn.
+
         Client Turn Arguments:
             There are lines of code commented out that create Action Objects instead of using the enum. If your project
             needs Actions Objects instead of the enums, comment out the enums and use Objects as necessary.
@@ -40,19 +51,51 @@ class MasterController(Controller):
         Return Final Results:
             This method creates a dictionary that stores a list of the clients' JSON files. This represents the final
             results of the game.
+
+        Quiet Mode:
+            In quiet mode, nothing is printed, so the text of the turn's events and the final scores are never made.
+            The events and scores are still in the turn logs and the results.
     """
 
-    def __init__(self):
+    def __init__(self, quiet_mode: bool = False):
         super().__init__()
+        self.quiet_mode: bool = quiet_mode
         self.game_over: bool = False
         # self.event_timer = GameStats.event_timer   # anything related to events are commented it out until made
         # self.event_times: tuple[int, int] | None = None
         self.turn: int = 1
-        self.current_world_data: dict = None
+        self.game_board: GameBoard | None = None
+        self.current_world_data: dict | None = None
         self.swap_controller: SwapController = SwapController()
         self.select_move_controller: SelectMoveController = SelectMoveController()
         self.move_controller: MoveController = MoveController()
 
+    @property
+    def current_world_data(self) -> dict | None:
+        # the live game board is only serialized when something asks for the world as JSON
+        if self.__current_world_data is not None and self.game_board is not None:
+            self.__current_world_data['game_board'] = self.game_board.to_json()
+
+        return self.__current_world_data
+
+    @current_world_data.setter
+    def current_world_data(self, current_world_data: dict | None) -> None:
+        if current_world_data is not None and not isinstance(current_world_data, dict):
+            raise ValueError(f'{self.__class__.__name__}.current_world_data must be a dict or None. It is a(n) '
+                             f'{current_world_data.__class__.__name__} and has the value of {current_world_data}')
+
+        self.__current_world_data = current_world_data
+
+        # the new world data replaces the live game board; it will be decoded the next time it's needed
+        self.game_board = None
+
+    def get_game_board(self) -> GameBoard:
+        """
+        Returns the live GameBoard. The world data is only decoded the first time this is called after the world data
+        is given to the master controller.
+        """
+        ...
+
     # Receives all clients for the purpose of giving them the objects they will control
     def give_clients_objects(self, clients: list[Player], world: dict, team_managers: list[TeamManager]):
         ...
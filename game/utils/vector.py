@@ -1,9 +1,13 @@
-from game.common.game_object import GameObject
+import uuid
+
 from game.common.enums import ObjectType
 from typing import Self, Tuple
 
+# Vectors with both coordinates in this range are interned, so all the Vectors of a coordinate are the same object
+INTERNED_RANGE: range = range(-64, 64)
+
 
-class Vector(GameObject):
+class Vector:
     """
     `Vector Class Notes:`
 
@@ -60,33 +64,48 @@ class Vector(GameObject):
     As Tuple Method:
         This method returns a tuple of the Vector object in the form of (x, y). This is to help with storing it easily
         or accessing it in an immutable structure.
+
+    -----
+
+    Vectors are immutable. Every method that changes a Vector returns a new one instead, so a Vector can be shared by
+    anything that uses it (e.g., the game map, characters, and snapshots given to the clients). Vectors on the board
+    are interned and their hash is computed once, so creating, comparing, and hashing them is cheap.
+
+    Vectors aren't GameObjects, but they are written to json the same way. Their id is made from their coordinates, so
+    equal Vectors have the same id.
     """
 
-    def __init__(self, x: int = 0, y: int = 0):
-        super().__init__()
-        self.object_type: ObjectType = ObjectType.VECTOR
-        self.x = x
-        self.y = y
+    __slots__ = ('__x', '__y', '__hash', '__id')
+
+    __interned: dict[tuple[int, int], 'Vector'] = {}
+
+    def __new__(cls, x: int = 0, y: int = 0):
+        ...
 
     @property
     def x(self) -> int:
         return self.__x
 
-    @x.setter
-    def x(self, x: int) -> None:
-        if x is None or not isinstance(x, int):
-            raise ValueError(f"The given x value, {x}, is not an integer.")
-        self.__x = x
-
     @property
     def y(self) -> int:
         return self.__y
 
-    @y.setter
-    def y(self, y: int) -> None:
-        if y is None or not isinstance(y, int):
-            raise ValueError(f"The given y value, {y}, is not an integer.")
-        self.__y = y
+    @property
+    def id(self) -> str:
+        # the id is only needed when the Vector is written to json, so it's made the first time it's used
+        if self.__id is None:
+            vector_id: str = str(uuid.uuid5(uuid.NAMESPACE_OID, f'vector:{self.__x},{self.__y}'))
+            object.__setattr__(self, '_Vector__id', vector_id)
+
+        return self.__id
+
+    @property
+    def object_type(self) -> ObjectType:
+        return ObjectType.VECTOR
+
+    @property
+    def state(self) -> str:
+        return 'idle'
 
     @staticmethod
     def from_xy_tuple(xy_tuple: Tuple[int, int]) -> 'Vector':
@@ -115,11 +134,31 @@ class Vector(GameObject):
     def as_tuple(self) -> Tuple[int, int]:
         ...
 
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f'{self.__class__.__name__} objects can\'t be changed. Create a new '
+                             f'{self.__class__.__name__} instead.')
+
+    def __reduce__(self) -> tuple:
+        # pickled Vectors are created with Vector() so they are interned in the process that loads them
+        return Vector, (self.x, self.y)
+
+    def __copy__(self) -> Self:
+        return self
+
+    def __deepcopy__(self, memo: dict) -> Self:
+        return self
+
     def __str__(self) -> str:
         return f'({self.x}, {self.y})'
 
     def __hash__(self):
-        return hash(self.as_tuple())
+        return self.__hash
 
     def __eq__(self, other) -> bool:
-        return self.as_tuple() == other.as_tuple()
+        if self is other:
+            return True
+
+        if not isinstance(other, Vector):
+            return NotImplemented
+
+        return self.__x == other.__x and self.__y == other.__y